@@ -8,23 +8,47 @@ classes that translate SQL queries into HTTP requests.
 
 from __future__ import annotations
 
+import base64
 import json
 import logging
+import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from importlib.metadata import version
+from itertools import islice
+from itertools import zip_longest
 from typing import Any
 from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
 from typing import Sequence
 from typing import Tuple
 from typing import Union
-from urllib.parse import urljoin
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency for faster JSON decoding
+    orjson = None
 
 logger = logging.getLogger("sqlalchemy.dialects.opteryx")
 
+# orjson is several times faster than the stdlib decoder; both accept bytes
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encode a request body as JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
 try:
     __version__ = version("opteryx-sqlalchemy")
 except Exception:
@@ -35,6 +59,44 @@ apilevel = "2.0"
 threadsafety = 1  # Threads may share the module, but not connections
 paramstyle = "named"  # Named style: WHERE name=:name
 
+# HTTP connection pool settings; a single query issues auth, submit, status and
+# results requests against the same host so keep enough sockets alive to reuse them
+_POOL_CONNECTIONS = 4
+_POOL_MAXSIZE = 64
+_RETRY_TOTAL = 3
+_RETRY_BACKOFF_FACTOR = 0.2
+_RETRY_STATUS_FORCELIST = (502, 503, 504)
+
+# Status polls ask the server to block for up to this long waiting for completion;
+# an unchanged state returned faster than the minimum means long-polling is unsupported
+_LONG_POLL_WAIT_SECONDS = 25
+_LONG_POLL_MIN_BLOCK_SECONDS = 1.0
+
+# Positional parameter placeholder, rewritten to :pN named parameters in a single pass
+_QMARK_RE = re.compile(r"\?")
+
+# Characters that would let an execution ID escape its URL path segment
+_UNSAFE_HANDLE_RE = re.compile(r"[/?#\\]|^\.\.?$")
+
+# Statement states after which results can be fetched
+_COMPLETED_STATES = frozenset(("COMPLETED", "SUCCEEDED", "INCHOATE"))
+# Statement states after which the status will not change again
+_FINISHED_STATES = _COMPLETED_STATES | {"FAILED", "CANCELLED"}
+
+# Refresh cached JWTs this long before they expire; tokens without a readable
+# 'exp' claim are assumed to live for the fallback period
+_TOKEN_REFRESH_MARGIN_SECONDS = 30
+_TOKEN_FALLBACK_TTL_SECONDS = 300
+
+# After authentication fails, skip re-authenticating for this long
+_AUTH_FAILURE_BACKOFF_SECONDS = 60
+
+# Upper bound on concurrent result-page downloads once the total row count is known
+_MAX_PAGE_WORKERS = 8
+
+# Result downloads larger than this are parsed line-by-line as they stream in
+_STREAM_THRESHOLD_BYTES = 1024 * 1024
+
 
 class Error(Exception):
     """Base exception for DBAPI errors."""
@@ -104,18 +166,67 @@ DATETIME = str
 ROWID = str
 
 
+# Shared by all connections so opening and closing connections (as a SQLAlchemy pool
+# does) reuses established TCP/TLS connections instead of handshaking each time;
+# larger keep-alive pool and retries on transient gateway errors. Read errors are not
+# retried: the server may already have accepted a submit that timed out (it long-polls),
+# and retrying the POST would start the statement again
+_SHARED_ADAPTER = HTTPAdapter(
+    pool_connections=_POOL_CONNECTIONS,
+    pool_maxsize=_POOL_MAXSIZE,
+    max_retries=Retry(
+        total=_RETRY_TOTAL,
+        read=0,
+        backoff_factor=_RETRY_BACKOFF_FACTOR,
+        status_forcelist=_RETRY_STATUS_FORCELIST,
+        allowed_methods=frozenset(["GET", "POST"]),
+        raise_on_status=False,
+    ),
+)
+
+
+def _parse_state(status: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+    """Return the upper-cased statement state and any status details from a response."""
+    raw_state = status.get("status")
+
+    if isinstance(raw_state, dict):
+        state_value = raw_state.get("state")
+        status_details = raw_state
+    else:
+        state_value = raw_state
+        status_details = {}
+
+    if not state_value:
+        state_value = status.get("state")
+
+    return (state_value or "UNKNOWN").upper(), status_details
+
+
 class Cursor:
     """DBAPI 2.0 Cursor implementation for Opteryx."""
 
+    __slots__ = (
+        "_connection",
+        "_jwt_token",
+        "_description",
+        "_rowcount",
+        "_row_iter",
+        "_arraysize",
+        "_closed",
+        "_statement_handle",
+        "_opteryx_execution_options",
+        "_opteryx_stream_results_requested",
+        "_opteryx_max_row_buffer",
+    )
+
     def __init__(self, connection: "Connection") -> None:
         self._connection = connection
-        self._jwt_token: Optional[str] = None
         self._description: Optional[
             List[Tuple[str, Any, None, None, None, None, Optional[bool]]]
         ] = None
         self._rowcount = -1
-        self._rows: List[Tuple[Any, ...]] = []
-        self._row_index = 0
+        # Yields the rows not yet fetched; fetch methods consume it without slicing
+        self._row_iter: Iterator[Tuple[Any, ...]] = iter(())
         self._arraysize = 1
         self._closed = False
         self._statement_handle: Optional[str] = None
@@ -125,68 +236,8 @@ class Cursor:
         self._opteryx_stream_results_requested: bool = False
         self._opteryx_max_row_buffer: Optional[int] = None
 
-        # Try to authenticate using client credentials (client credentials flow)
-        # client_id is connection._username and client_secret is connection._token
-        try:
-            username = getattr(self._connection, "_username", None)
-            secret = getattr(self._connection, "_token", None)
-            if username and secret:
-                logger.debug("Attempting client credentials authentication for user: %s", username)
-                host = getattr(self._connection, "_host", "localhost")
-                # Normalize domain and build auth host (auth.domain)
-                try:
-                    domain = self._connection._normalize_domain(host)
-                except Exception as e:
-                    logger.debug("Failed to normalize domain '%s': %s", host, e)
-                    domain = host
-                # Only add auth. prefix when domain looks like a DNS name (not 'localhost')
-                if "." in domain and not domain.startswith("localhost"):
-                    auth_host = f"authenticate.{domain}"
-                else:
-                    auth_host = domain
-                scheme = "https" if getattr(self._connection, "_ssl", False) else "http"
-                auth_url = f"{scheme}://{auth_host}/token"
-                logger.debug("Authentication URL: %s", auth_url)
-
-                # Build form-encoded payload
-                payload = {
-                    "grant_type": "client_credentials",
-                    "client_id": username,
-                    "client_secret": secret,
-                }
-                # Use the connection session for auth so auth header set for all subsequent calls
-                sess = getattr(self._connection, "_session", requests.Session())
-                headers = {
-                    "accept": "application/json",
-                    "Content-Type": "application/x-www-form-urlencoded",
-                }
-                resp = sess.post(
-                    auth_url,
-                    data=payload,
-                    headers=headers,
-                    timeout=getattr(self._connection, "_timeout", 30),
-                )
-                resp.raise_for_status()
-                body = resp.json() if resp.text else {}
-                token = body.get("access_token") or body.get("token") or body.get("jwt")
-                if token:
-                    self._jwt_token = token
-                    logger.info("Authentication successful for user: %s", username)
-                    # Set Authorization header for subsequent requests via the connection session
-                    try:
-                        self._connection._session.headers["Authorization"] = f"Bearer {token}"
-                    except Exception as e:
-                        logger.warning("Failed to set Authorization header: %s", e)
-                else:
-                    logger.warning("Authentication response missing token for user: %s", username)
-        except requests.exceptions.RequestException as e:
-            # Authentication failed — don't raise here; we will attempt queries without the JWT
-            logger.warning("Authentication failed for user %s: %s", username, e)
-            self._jwt_token = None
-        except Exception as e:
-            # Any unexpected failure in auth should not crash cursor creation
-            logger.error("Unexpected error during authentication: %s", e, exc_info=True)
-            self._jwt_token = None
+        # The connection authenticates; cursors only record the JWT in use
+        self._jwt_token: Optional[str] = connection._jwt_token
 
     @property
     def description(
@@ -212,7 +263,7 @@ class Cursor:
     def close(self) -> None:
         """Close the cursor."""
         self._closed = True
-        self._rows = []
+        self._row_iter = iter(())
         self._description = None
 
     def _check_closed(self) -> None:
@@ -220,6 +271,47 @@ class Cursor:
         if self._closed:
             raise ProgrammingError("Cursor is closed")
 
+    def _reset_results(self) -> None:
+        """Clear the results of any previous statement."""
+        self._row_iter = iter(())
+        self._description = None
+        self._rowcount = -1
+
+    @staticmethod
+    def _prepare_operation(
+        operation: str, parameters: Optional[Union[Dict[str, Any], Sequence[Any]]]
+    ) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """Convert sequence parameters to named ones, rewriting ? placeholders to match."""
+        if parameters is None or isinstance(parameters, dict):
+            return operation, parameters
+        # Convert positional to named parameters
+        params_dict = {f"p{i}": v for i, v in enumerate(parameters)}
+        # Replace the first len(parameters) ? placeholders with :p0, :p1, etc.
+        if parameters:
+            operation = _QMARK_RE.sub(
+                lambda _m, it=iter(range(len(parameters))): f":p{next(it)}",
+                operation,
+                count=len(parameters),
+            )
+        return operation, params_dict
+
+    @staticmethod
+    def _statement_handle_from(response: Dict[str, Any]) -> str:
+        """Return the execution ID from a submit response.
+
+        The handle is later appended to endpoint URLs, so it must be a single opaque
+        path segment.
+        """
+        handle = response.get("execution_id")
+        if not handle:
+            logger.error("No execution ID in response: %s", response)
+            raise DatabaseError("No statement handle returned from server")
+        handle = str(handle)
+        if _UNSAFE_HANDLE_RE.search(handle):
+            logger.error("Invalid execution ID in response: %s", handle)
+            raise DatabaseError(f"Invalid statement handle returned from server: {handle}")
+        return handle
+
     def execute(
         self,
         operation: str,
@@ -235,10 +327,7 @@ class Cursor:
             Self for method chaining
         """
         self._check_closed()
-        self._rows = []
-        self._row_index = 0
-        self._description = None
-        self._rowcount = -1
+        self._reset_results()
 
         # Log query (truncate if too long)
         query_preview = operation[:200] + "..." if len(operation) > 200 else operation
@@ -246,31 +335,28 @@ class Cursor:
         if parameters:
             logger.debug("Query parameters: %s", parameters)
 
-        # Convert sequence parameters to dict if needed
-        params_dict: Optional[Dict[str, Any]] = None
-        if parameters is not None:
-            if isinstance(parameters, dict):
-                params_dict = parameters
-            else:
-                # Convert positional to named parameters
-                params_dict = {f"p{i}": v for i, v in enumerate(parameters)}
-                # Replace ? placeholders with :p0, :p1, etc.
-                for i in range(len(parameters)):
-                    operation = operation.replace("?", f":p{i}", 1)
+        operation, params_dict = self._prepare_operation(operation, parameters)
 
-        # Submit the statement
+        # Submit the statement, asking the server to wait for it and inline the first page
         start_time = time.time()
-        response = self._connection._submit_statement(operation, params_dict)
-        self._statement_handle = response.get("execution_id")
-
-        if not self._statement_handle:
-            logger.error("No execution ID in response: %s", response)
-            raise DatabaseError("No statement handle returned from server")
+        response = self._connection._submit_and_wait(
+            operation,
+            params_dict,
+            wait_seconds=_LONG_POLL_WAIT_SECONDS,
+            first_page_size=self._page_size(),
+        )
+        self._statement_handle = self._statement_handle_from(response)
 
         logger.debug("Statement submitted with execution_id: %s", self._statement_handle)
 
-        # Poll for completion
-        self._poll_for_results()
+        state, _ = _parse_state(response)
+        if state in _COMPLETED_STATES and ("data" in response or "columns" in response):
+            # The server finished the statement and returned results with the submit
+            logger.debug("Statement results returned inline with state: %s", state)
+            self._fetch_results(response)
+        else:
+            # Poll for completion
+            self._poll_for_results()
 
         elapsed = time.time() - start_time
         logger.info("Query completed in %.2fs, returned %d rows", elapsed, self._rowcount)
@@ -283,104 +369,138 @@ class Cursor:
 
         return self
 
-    def _poll_for_results(self) -> None:
-        """Poll the server until statement execution completes."""
+    def _poll_for_results(self) -> Optional[Dict[str, Any]]:
+        """Poll the server until statement execution completes.
+
+        Status requests ask the server to hold the request open until the statement
+        reaches a terminal state (long-polling). If the server answers immediately
+        with an unchanged state it doesn't support this, so fall back to sleeping
+        between polls with an increasing interval.
+
+        Returns:
+            The final status response of the completed statement
+        """
         if not self._statement_handle:
-            return
+            return None
 
         max_wait = 300  # Maximum wait time in seconds
-        poll_interval = 0.5  # Initial poll interval in seconds
+        poll_interval = 0.5  # Initial poll interval in seconds (fallback only)
+        wait_seconds: Optional[int] = _LONG_POLL_WAIT_SECONDS
+        start_time = time.monotonic()
         elapsed = 0.0
         last_log_time = 0.0  # Track when we last logged progress
         log_interval = 5.0  # Log progress every 5 seconds
+        previous_state: Optional[str] = None
 
         logger.debug("Polling for execution_id: %s", self._statement_handle)
 
-        while elapsed < max_wait:
-            status = self._connection._get_statement_status(self._statement_handle)
-            raw_state = status.get("status")
-
-            if isinstance(raw_state, dict):
-                state_value = raw_state.get("state")
-                status_details = raw_state
-            else:
-                state_value = raw_state
-                status_details = {}
-
-            if not state_value:
-                state_value = status.get("state")
-
-            normalized_state = (state_value or "UNKNOWN").upper()
-
-            # Log progress periodically for long-running queries
-            if elapsed - last_log_time >= log_interval:
-                logger.info(
-                    "Query still executing (state=%s, elapsed=%.1fs)", normalized_state, elapsed
-                )
-                last_log_time = elapsed
-
-            if normalized_state in ("COMPLETED", "SUCCEEDED", "INCHOATE"):
-                logger.debug("Query execution completed with state: %s", normalized_state)
-                self._fetch_results()
-                return
-            if normalized_state in ("FAILED", "CANCELLED"):
-                error_message = (
-                    status.get("error_message")
-                    or status_details.get("description")
-                    or status.get("description")
-                    or status.get("detail")
-                    or "Unknown error"
+        try:
+            while elapsed < max_wait:
+                request_start = time.monotonic()
+                status = self._connection._get_statement_status(
+                    self._statement_handle, wait_seconds=wait_seconds
                 )
-                logger.error("Query failed with state %s: %s", normalized_state, error_message)
-                raise ProgrammingError(error_message)
-            if normalized_state in ("UNKNOWN", "SUBMITTED", "EXECUTING", "RUNNING"):
-                logger.debug("Query state: %s (elapsed: %.1fs)", normalized_state, elapsed)
-                time.sleep(poll_interval)
-                elapsed += poll_interval
-                poll_interval = min(poll_interval * 1.5, 2.5)
-                continue
-
-            logger.error("Unexpected statement state: %s", state_value)
-            raise DatabaseError(f"Unknown statement state: {state_value}")
+                request_time = time.monotonic() - request_start
+                normalized_state, status_details = _parse_state(status)
 
-        logger.error("Query execution timed out after %.1fs", elapsed)
-        raise OperationalError("Statement execution timed out")
+                # Log progress periodically for long-running queries
+                if elapsed - last_log_time >= log_interval:
+                    logger.info(
+                        "Query still executing (state=%s, elapsed=%.1fs)", normalized_state, elapsed
+                    )
+                    last_log_time = elapsed
+
+                if normalized_state in _COMPLETED_STATES:
+                    logger.debug("Query execution completed with state: %s", normalized_state)
+                    self._fetch_results(status)
+                    return status
+                if normalized_state in ("FAILED", "CANCELLED"):
+                    error_message = (
+                        status.get("error_message")
+                        or status_details.get("description")
+                        or status.get("description")
+                        or status.get("detail")
+                        or "Unknown error"
+                    )
+                    logger.error("Query failed with state %s: %s", normalized_state, error_message)
+                    raise ProgrammingError(error_message)
+                if normalized_state in ("UNKNOWN", "SUBMITTED", "EXECUTING", "RUNNING"):
+                    logger.debug("Query state: %s (elapsed: %.1fs)", normalized_state, elapsed)
+                    if (
+                        wait_seconds
+                        and normalized_state == previous_state
+                        and request_time < _LONG_POLL_MIN_BLOCK_SECONDS
+                    ):
+                        logger.debug(
+                            "Server does not support long-polling, falling back to backoff"
+                        )
+                        wait_seconds = None
+                    if not wait_seconds:
+                        time.sleep(poll_interval)
+                        poll_interval = min(poll_interval * 1.5, 2.5)
+                    previous_state = normalized_state
+                    elapsed = time.monotonic() - start_time
+                    continue
+
+                logger.error("Unexpected statement state: %s", normalized_state)
+                raise DatabaseError(f"Unknown statement state: {normalized_state}")
+
+            logger.error("Query execution timed out after %.1fs", elapsed)
+            raise OperationalError("Statement execution timed out")
+        finally:
+            # Drop the cached status however polling ends (completion, failure, timeout
+            # or an exception) so the ETag cache doesn't grow with abandoned handles
+            self._connection._status_etags.pop(self._statement_handle, None)
 
     @staticmethod
-    def _rows_from_columnar_data(column_data: Sequence[Dict[str, Any]]) -> List[Tuple[Any, ...]]:
-        """Convert column-oriented payloads into row tuples."""
-        column_values: List[List[Any]] = []
-        for column in column_data:
-            if not isinstance(column, dict):
-                continue
-            values = column.get("values") or []
-            column_values.append(list(values))
-        if not column_values:
-            return []
-        max_rows = max((len(values) for values in column_values), default=0)
+    def _make_description(
+        columns_meta: List[Dict[str, Any]],
+    ) -> List[Tuple[str, Any, None, None, None, None, Optional[bool]]]:
+        """Build a PEP 249 description from result column metadata."""
         return [
-            tuple(
-                column_values[col_index][row_index]
-                if row_index < len(column_values[col_index])
-                else None
-                for col_index in range(len(column_values))
-            )
-            for row_index in range(max_rows)
+            (col.get("name", f"col{i}"), None, None, None, None, None, None)
+            for i, col in enumerate(columns_meta)
         ]
 
-    def _fetch_results(self) -> None:
-        """Fetch results from a completed statement."""
+    def _page_size(self) -> int:
+        """Number of rows to request per results page."""
+        return max(self._opteryx_max_row_buffer or 10, self._arraysize)
+
+    def _fetch_results(self, first_page: Optional[Dict[str, Any]] = None) -> None:
+        """Fetch results from a completed statement.
+
+        Args:
+            first_page: A completed status (or inline submit) response that has already
+                been received; when omitted the statement status is requested first
+        """
         if not self._statement_handle:
             return
 
-        page_size = max(self._opteryx_max_row_buffer or 10, self._arraysize)
+        page_size = self._page_size()
         offset = 0
         has_description = False
+        # Column names in description order, used to lay out row-format pages
+        col_names: List[str] = []
         rows: List[Tuple[Any, ...]] = []
+        # Columnar pages are kept as columns (and only turned into tuples as rows are
+        # fetched) until a page arrives in a row-oriented format
+        columns: Optional[List[List[Any]]] = None
         total_rows: Optional[int] = None
 
+        def materialize_columns() -> None:
+            nonlocal columns
+            if columns is not None:
+                rows.extend(zip_longest(*columns))
+                columns = None
+
+        def set_description(columns_meta: List[Dict[str, Any]]) -> None:
+            nonlocal has_description, col_names
+            self._description = self._make_description(columns_meta)
+            col_names = [name for name, *_ in self._description]
+            has_description = True
+
         def process_result_page(result: Dict[str, Any]) -> int:
-            nonlocal has_description, total_rows
+            nonlocal total_rows, columns
             new_rows = 0
             if total_rows is None and "total_rows" in result:
                 try:
@@ -390,51 +510,68 @@ class Cursor:
 
             columns_meta = result.get("columns", [])
             if columns_meta and not has_description:
-                self._description = [
-                    (col.get("name", f"col{i}"), None, None, None, None, None, None)
-                    for i, col in enumerate(columns_meta)
-                ]
-                has_description = True
+                set_description(columns_meta)
 
             data = result.get("data", [])
             if data:
                 if isinstance(data[0], dict) and "values" in data[0]:
                     # Columnar format: each dict has {name: ..., values: [...]}
                     if not has_description:
-                        self._description = [
-                            (col.get("name", f"col{i}"), None, None, None, None, None, None)
-                            for i, col in enumerate(data)
-                        ]
-                        has_description = True
-                    column_rows = self._rows_from_columnar_data(data)
-                    rows.extend(column_rows)
-                    new_rows = len(column_rows)
+                        set_description(data)
+                    values_lists = [col.get("values") or [] for col in data]
+                    new_rows = max(map(len, values_lists), default=0)
+                    if rows:
+                        rows.extend(zip_longest(*values_lists))
+                    elif columns is None:
+                        columns = values_lists
+                    else:
+                        for column, values in zip(columns, values_lists):
+                            column.extend(values)
+                    if columns is not None:
+                        # Pad short columns so every column holds one value per row
+                        target = max(map(len, columns), default=0)
+                        for column in columns:
+                            column.extend([None] * (target - len(column)))
                 elif isinstance(data[0], dict):
+                    materialize_columns()
                     # Row format: each dict is a row with {col1: val1, col2: val2, ...}
-                    if not has_description and data:
+                    if not has_description:
                         # Extract column names from first row
-                        col_names = list(data[0].keys())
-                        self._description = [
-                            (col_name, None, None, None, None, None, None) for col_name in col_names
-                        ]
-                        has_description = True
+                        set_description([{"name": name} for name in data[0]])
                     # Convert each row dict to a tuple in the correct column order
-                    col_order = [col[0] for col in (self._description or [])]
-                    for row_dict in data:
-                        row_tuple = tuple(row_dict.get(col) for col in col_order)
-                        rows.append(row_tuple)
+                    rows.extend(
+                        tuple([row_dict.get(col) for col in col_names]) for row_dict in data
+                    )
                     new_rows = len(data)
                 else:
                     # List/tuple format
-                    for row in data:
-                        rows.append(tuple(row))
+                    materialize_columns()
+                    rows.extend(map(tuple, data))
                     new_rows = len(data)
 
             return new_rows
 
-        status_result = self._connection._get_statement_status(self._statement_handle)  # pylint: disable=protected-access
-        process_result_page(status_result)
-        offset = len(rows)
+        if first_page is None:
+            first_page = self._connection._get_statement_status(self._statement_handle)  # pylint: disable=protected-access
+        offset = process_result_page(first_page)
+
+        # With the row count known every remaining page can be requested independently,
+        # so download them concurrently and process them in offset order
+        remaining_offsets = (
+            range(offset, total_rows, page_size) if total_rows is not None else range(0)
+        )
+        if len(remaining_offsets) > 1:
+
+            def fetch_page(page_offset: int) -> Dict[str, Any]:
+                return self._connection._get_statement_results(  # pylint: disable=protected-access
+                    self._statement_handle, num_rows=page_size, offset=page_offset
+                )
+
+            workers = min(_MAX_PAGE_WORKERS, len(remaining_offsets))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for result in executor.map(fetch_page, remaining_offsets):
+                    process_result_page(result)
+            offset = total_rows
 
         while True:
             if total_rows is not None and offset >= total_rows:
@@ -453,16 +590,72 @@ class Cursor:
                 break
 
         # Finalize rows and counts
-        self._rows = rows
-        self._rowcount = len(self._rows)
+        if columns is not None:
+            self._rowcount = len(columns[0]) if columns else 0
+            # Tuples are built lazily as rows are fetched
+            self._row_iter = zip(*columns)
+        else:
+            self._rowcount = len(rows)
+            self._row_iter = iter(rows)
 
     def executemany(
         self,
         operation: str,
         seq_of_parameters: Sequence[Union[Dict[str, Any], Sequence[Any]]],
     ) -> "Cursor":
-        """Execute a SQL statement multiple times with different parameters."""
+        """Execute a SQL statement multiple times with different parameters.
+
+        All parameter sets are sent to the server in a single batched request. If the
+        server doesn't support batches, the statement is executed once per parameter set.
+        """
         self._check_closed()
+        seq_of_parameters = list(seq_of_parameters)
+        if not seq_of_parameters:
+            return self
+
+        # Normalize every parameter set to a dict; positional sets share one rewritten SQL
+        prepared = [self._prepare_operation(operation, p) for p in seq_of_parameters]
+        batch_sql = prepared[0][0]
+        batch = [params or {} for _, params in prepared]
+
+        # A batch is one statement, so every parameter set must be of the same kind and
+        # produce the same SQL (the same number of positional placeholders rewritten)
+        if (
+            self._connection._batch_unsupported  # pylint: disable=protected-access
+            or len({isinstance(p, dict) for p in seq_of_parameters}) > 1
+            or any(sql != batch_sql for sql, _ in prepared)
+        ):
+            return self._execute_each(operation, seq_of_parameters)
+
+        try:
+            response = self._connection._submit_batch(batch_sql, batch)
+        except NotSupportedError:
+            self._connection._batch_unsupported = True  # pylint: disable=protected-access
+            return self._execute_each(operation, seq_of_parameters)
+
+        self._reset_results()
+        self._statement_handle = self._statement_handle_from(response)
+
+        status = self._poll_for_results() or {}
+        # The server reports either one affected-row count per parameter set or a total
+        rows_affected = status.get("rows_affected")
+        if isinstance(rows_affected, list):
+            self._rowcount = sum(int(count or 0) for count in rows_affected)
+        elif isinstance(rows_affected, int):
+            self._rowcount = rows_affected
+        else:
+            self._rowcount = -1
+        if self._description is None:
+            self._description = []
+        return self
+
+    def _execute_each(
+        self,
+        operation: str,
+        seq_of_parameters: Sequence[Union[Dict[str, Any], Sequence[Any]]],
+    ) -> "Cursor":
+        """Execute the statement once per parameter set, for when it can't be batched."""
+        logger.debug("Executing %d statements individually", len(seq_of_parameters))
         for parameters in seq_of_parameters:
             self.execute(operation, parameters)
         return self
@@ -470,27 +663,20 @@ class Cursor:
     def fetchone(self) -> Optional[Tuple[Any, ...]]:
         """Fetch the next row of a query result set."""
         self._check_closed()
-        if self._row_index >= len(self._rows):
-            return None
-        row = self._rows[self._row_index]
-        self._row_index += 1
-        return row
+        return next(self._row_iter, None)
 
     def fetchmany(self, size: Optional[int] = None) -> List[Tuple[Any, ...]]:
         """Fetch the next set of rows."""
         self._check_closed()
         if size is None:
             size = self._arraysize
-        rows = self._rows[self._row_index : self._row_index + size]
-        self._row_index += len(rows)
-        return rows
+        # islice rejects negative counts; treat them as requesting no rows
+        return list(islice(self._row_iter, max(size, 0)))
 
     def fetchall(self) -> List[Tuple[Any, ...]]:
         """Fetch all remaining rows."""
         self._check_closed()
-        rows = self._rows[self._row_index :]
-        self._row_index = len(self._rows)
-        return rows
+        return list(self._row_iter)
 
     def setinputsizes(self, sizes: Sequence[Any]) -> None:
         """Set input sizes (no-op, but required by PEP 249)."""
@@ -521,6 +707,28 @@ class Connection:
     Manages HTTP connections to the Opteryx data service.
     """
 
+    __slots__ = (
+        "_host",
+        "_port",
+        "_username",
+        "_token",
+        "_database",
+        "_ssl",
+        "_timeout",
+        "_closed",
+        "_status_etags",
+        "_jwt_token",
+        "_jwt_exp",
+        "_token_lock",
+        "_auth_disabled",
+        "_auth_failed_at",
+        "_batch_unsupported",
+        "_base_url",
+        "_session",
+        "_normalized_domain",
+        "_jobs_url",
+    )
+
     def __init__(
         self,
         host: str = "jobs.opteryx.app",
@@ -551,6 +759,19 @@ class Connection:
         self._timeout = timeout
         self._closed = False
 
+        # Last ETag and status body of each pending statement, keyed by execution ID
+        self._status_etags: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+
+        # Client credentials JWT shared by all cursors on this connection
+        self._jwt_token: Optional[str] = None
+        self._jwt_exp = 0.0
+        self._token_lock = threading.Lock()
+        # Set when authentication fails, so retries wait out the backoff
+        self._auth_disabled = False
+        self._auth_failed_at = 0.0
+        # Set once the server is seen not to execute batched parameter sets
+        self._batch_unsupported = False
+
         # Build base URL
         scheme = "https" if ssl else "http"
         if (ssl and port == 443) or (not ssl and port == 80):
@@ -569,6 +790,18 @@ class Connection:
             logger.debug("Using pre-configured token for authentication")
         self._session.headers["Content-Type"] = "application/json"
 
+        # Route requests through the module-wide adapter so every connection shares
+        # one keep-alive pool; sessions still carry their own per-connection headers
+        self._session.mount("http://", _SHARED_ADAPTER)
+        self._session.mount("https://", _SHARED_ADAPTER)
+
+        # URLs never change for the lifetime of the connection, so build them once
+        self._normalized_domain = self._normalize_domain(host)
+        self._jobs_url = self._data_base_url() + "/api/v1/jobs"
+
+        # Authenticate up front so creating cursors doesn't need any I/O
+        self._ensure_token()
+
     def _normalize_domain(self, host: str) -> str:
         """Return the base domain for the given host by stripping known subdomain prefixes.
 
@@ -587,7 +820,7 @@ class Connection:
     def _data_base_url(self) -> str:
         """Construct a base URL that targets the 'data' subdomain for API requests."""
         scheme = "https" if self._ssl else "http"
-        domain = self._normalize_domain(self._host)
+        domain = self._normalized_domain
         # Only add subdomain prefix for DNS-style hosts (e.g. example.com), not for localhost or IPs
         if "." in domain and not domain.startswith("localhost"):
             data_host = f"jobs.{domain}"
@@ -597,18 +830,120 @@ class Connection:
             return f"{scheme}://{data_host}"
         return f"{scheme}://{data_host}:{self._port}"
 
+    def _ensure_token(self) -> Optional[str]:
+        """Return a valid client credentials JWT, authenticating if none is cached.
+
+        The username is used as the client_id and the token as the client_secret. The
+        JWT is cached on the connection and only refreshed shortly before it expires.
+        """
+        if not (self._username and self._token):
+            return None
+        with self._token_lock:
+            if self._jwt_token and time.time() < self._jwt_exp - _TOKEN_REFRESH_MARGIN_SECONDS:
+                return self._jwt_token
+            if (
+                self._auth_disabled
+                and time.monotonic() - self._auth_failed_at < _AUTH_FAILURE_BACKOFF_SECONDS
+            ):
+                return self._jwt_token
+            self._authenticate()
+            return self._jwt_token
+
+    @staticmethod
+    def _token_expiry(token: str) -> float:
+        """Read the 'exp' claim from a JWT without verifying it."""
+        try:
+            payload = token.split(".")[1]
+            claims = json.loads(base64.urlsafe_b64decode(payload + "=="))
+            return float(claims["exp"])
+        except (IndexError, KeyError, TypeError, ValueError):
+            return time.time() + _TOKEN_FALLBACK_TTL_SECONDS
+
+    def _authenticate(self) -> None:
+        """Exchange the client credentials for a JWT and use it for subsequent requests."""
+        username = self._username
+        try:
+            logger.debug("Attempting client credentials authentication for user: %s", username)
+            # Build auth host (auth.domain) from the normalized domain
+            domain = self._normalized_domain
+            # Only add auth. prefix when domain looks like a DNS name (not 'localhost')
+            if "." in domain and not domain.startswith("localhost"):
+                auth_host = f"authenticate.{domain}"
+            else:
+                auth_host = domain
+            scheme = "https" if self._ssl else "http"
+            auth_url = f"{scheme}://{auth_host}/token"
+            logger.debug("Authentication URL: %s", auth_url)
+
+            # Build form-encoded payload
+            payload = {
+                "grant_type": "client_credentials",
+                "client_id": username,
+                "client_secret": self._token,
+            }
+            headers = {
+                "accept": "application/json",
+                "Content-Type": "application/x-www-form-urlencoded",
+            }
+            resp = self._session.post(
+                auth_url, data=payload, headers=headers, timeout=self._timeout
+            )
+            resp.raise_for_status()
+            body = _json_loads(resp.content) if resp.content else {}
+            token = body.get("access_token") or body.get("token") or body.get("jwt")
+            if token:
+                self._jwt_token = token
+                self._jwt_exp = self._token_expiry(token)
+                self._auth_disabled = False
+                logger.info("Authentication successful for user: %s", username)
+                # Set Authorization header for subsequent requests via the session
+                self._session.headers["Authorization"] = f"Bearer {token}"
+            else:
+                logger.warning("Authentication response missing token for user: %s", username)
+                self._record_auth_failure()
+        except requests.exceptions.RequestException as e:
+            # Authentication failed — don't raise here; we will attempt queries without the JWT
+            logger.warning("Authentication failed for user %s: %s", username, e)
+            self._record_auth_failure()
+        except Exception as e:
+            # Any unexpected failure in auth should not crash connection creation
+            logger.error("Unexpected error during authentication: %s", e, exc_info=True)
+            self._record_auth_failure()
+
+    def _record_auth_failure(self) -> None:
+        """Drop the JWT and skip re-authenticating until the backoff period has passed."""
+        self._jwt_token = None
+        self._auth_disabled = True
+        self._auth_failed_at = time.monotonic()
+        # Don't keep sending a JWT that may have expired; fall back to the configured token
+        self._session.headers["Authorization"] = f"Bearer {self._token}"
+
     def _check_closed(self) -> None:
         """Raise exception if connection is closed."""
         if self._closed:
             raise ProgrammingError("Connection is closed")
 
     def _submit_statement(
-        self, sql: str, parameters: Optional[Dict[str, Any]] = None
+        self,
+        sql: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        options: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
     ) -> Dict[str, Any]:
-        """Submit a SQL statement to the data service."""
+        """Submit a SQL statement to the data service.
+
+        Args:
+            sql: SQL statement to submit
+            parameters: Optional named parameters for the statement
+            options: Optional extra fields to include in the request payload
+            timeout: Request timeout in seconds, defaults to the connection timeout
+        """
         self._check_closed()
+        # Refresh the JWT once it nears expiry; after a failed login this is a no-op
+        # until the backoff period has passed
+        self._ensure_token()
 
-        url = urljoin(self._data_base_url() + "/", "api/v1/jobs")
+        url = self._jobs_url
         payload: Dict[str, Any] = {
             "sql_text": sql,
             "client_info": {
@@ -618,13 +953,18 @@ class Connection:
         }
         if parameters:
             payload["parameters"] = parameters
+        if options:
+            payload.update(options)
 
         logger.debug("Submitting statement to %s", url)
 
         try:
-            response = self._session.post(url, json=payload, timeout=self._timeout)
+            # The session already sends Content-Type: application/json
+            response = self._session.post(
+                url, data=_json_dumps(payload), timeout=timeout or self._timeout
+            )
             response.raise_for_status()
-            result = response.json()
+            result = _json_loads(response.content)
             logger.debug(
                 "Statement submitted successfully, execution_id: %s", result.get("execution_id")
             )
@@ -644,6 +984,10 @@ class Connection:
                     detail = e.response.json().get("detail", str(e))
                 except (ValueError, json.JSONDecodeError):
                     detail = e.response.text or str(e)
+                # The endpoint or request shape isn't supported by this server
+                if status_code in (404, 405, 501):
+                    logger.error("Unsupported request (HTTP %d): %s", status_code, detail)
+                    raise NotSupportedError(f"Not supported: {detail}") from e
                 logger.error("HTTP error %d submitting statement: %s", status_code, detail)
                 raise DatabaseError(f"HTTP error: {detail}") from e
             logger.error("HTTP error submitting statement: %s", e)
@@ -652,19 +996,75 @@ class Connection:
             logger.error("Connection error submitting statement: %s", e)
             raise OperationalError(f"Connection error: {e}") from e
 
-    def _get_statement_status(self, statement_handle: str) -> Dict[str, Any]:
-        """Get the status of a submitted statement."""
+    def _submit_and_wait(
+        self,
+        sql: str,
+        parameters: Optional[Dict[str, Any]],
+        wait_seconds: int,
+        first_page_size: int,
+    ) -> Dict[str, Any]:
+        """Submit a statement, asking the server to wait for it and inline the first page.
+
+        Servers that support this return the final status and the first page of
+        results in the submit response, saving the status and results round-trips.
+        Other servers return just the execution ID and the statement is polled as usual.
+        """
+        return self._submit_statement(
+            sql,
+            parameters,
+            options={"wait": wait_seconds, "fetch_rows": first_page_size},
+            timeout=max(self._timeout, wait_seconds + 5),
+        )
+
+    def _submit_batch(self, sql: str, seq_of_parameters: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Submit one statement to be executed once for each parameter set.
+
+        Raises:
+            NotSupportedError: If the server doesn't accept batched statements
+        """
+        return self._submit_statement(sql, options={"batch": seq_of_parameters})
+
+    def _get_statement_status(
+        self, statement_handle: str, wait_seconds: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Get the status of a submitted statement.
+
+        Args:
+            statement_handle: The execution ID returned by submit
+            wait_seconds: If set, ask the server to hold the request open for up to this
+                many seconds until the statement reaches a terminal state (long-polling)
+        """
         self._check_closed()
 
-        url = urljoin(self._data_base_url() + "/", f"api/v1/jobs/{statement_handle}/status")
+        url = f"{self._jobs_url}/{statement_handle}/status"
+        params: Optional[Dict[str, Any]] = None
+        timeout = self._timeout
+        if wait_seconds:
+            params = {"wait": int(wait_seconds)}
+            timeout = max(self._timeout, wait_seconds + 5)
+
+        # Revalidate the last status so an unchanged statement costs an empty 304
+        headers: Optional[Dict[str, str]] = None
+        cached = self._status_etags.get(statement_handle)
+        if cached is not None:
+            headers = {"If-None-Match": cached[0]}
 
         logger.debug("Checking status for execution_id: %s", statement_handle)
 
         try:
-            response = self._session.get(url, timeout=self._timeout)
+            response = self._session.get(url, params=params, headers=headers, timeout=timeout)
+            if response.status_code == 304 and cached is not None:
+                logger.debug("Status unchanged for execution_id: %s", statement_handle)
+                return cached[1]
             response.raise_for_status()
-            result = response.json()
+            result = _json_loads(response.content)
             logger.debug("Status check response: %s", result.get("status") or result.get("state"))
+            etag = response.headers.get("ETag")
+            state, _ = _parse_state(result)
+            if etag and state not in _FINISHED_STATES:
+                self._status_etags[statement_handle] = (etag, result)
+            else:
+                self._status_etags.pop(statement_handle, None)
             return result
         except requests.exceptions.HTTPError as e:
             if e.response is not None:
@@ -709,12 +1109,13 @@ class Connection:
             The download endpoint returns NDJSON (newline-delimited JSON), so we parse it and
             convert to the expected format.
         """
-        url = urljoin(self._data_base_url() + "/", f"api/v1/jobs/{statement_handle}/download")
-        params: Dict[str, Any] = {"file_format": "json"}
+        # The query values are integers, so build the query string directly rather than
+        # having requests URL-encode a params dict for every page
+        url = f"{self._jobs_url}/{statement_handle}/download?file_format=json"
         if num_rows is not None:
-            params["limit"] = int(num_rows)
+            url += f"&limit={int(num_rows)}"
         if offset is not None:
-            params["offset"] = int(offset)
+            url += f"&offset={int(offset)}"
 
         logger.debug(
             "Fetching results for execution_id: %s (limit=%s, offset=%s)",
@@ -724,20 +1125,23 @@ class Connection:
         )
 
         try:
-            response = self._session.get(url, params=params, timeout=self._timeout)
+            response = self._session.get(url, timeout=self._timeout, stream=True)
             response.raise_for_status()
 
-            # The download endpoint returns NDJSON (newline-delimited JSON)
-            # Parse each line as a separate JSON object (row)
-            rows = []
-            columns = None
-            for line in response.text.strip().split("\n"):
-                if line:
-                    row_dict = json.loads(line)
-                    if columns is None:
-                        # Extract column names from first row
-                        columns = list(row_dict.keys())
-                    rows.append(row_dict)
+            # The download endpoint returns NDJSON (newline-delimited JSON); parse each
+            # line as a separate JSON object (row). Large downloads are decoded as they
+            # arrive rather than buffering the whole body first.
+            try:
+                content_length = int(response.headers.get("Content-Length") or 0)
+            except (TypeError, ValueError):
+                content_length = 0
+            if content_length > _STREAM_THRESHOLD_BYTES:
+                lines = response.iter_lines()
+            else:
+                lines = response.content.splitlines()
+            rows = [_json_loads(line) for line in lines if line.strip()]
+            # Extract column names from first row
+            columns = list(rows[0].keys()) if rows else None
 
             # Convert to the format expected by process_result_page
             result = {"data": rows, "columns": [{"name": col} for col in (columns or [])]}
@@ -766,6 +1170,10 @@ class Connection:
         """Close the connection."""
         if not self._closed:
             logger.debug("Closing connection to %s", self._base_url)
+            # Unmount the shared adapter first so closing the session leaves its pool open
+            for prefix in ("http://", "https://"):
+                if self._session.adapters.get(prefix) is _SHARED_ADAPTER:
+                    del self._session.adapters[prefix]
             self._session.close()
             self._closed = True
 
@@ -360,6 +360,7 @@ def register_dialect() -> None:
     # Register using the correct module path for the installed package
     registry.register("opteryx", "sqlalchemy_dialect.dialect", "OptetyxDialect")
     registry.register("opteryx.http", "sqlalchemy_dialect.dialect", "OptetyxDialect")
+    registry.register("opteryx.async", "sqlalchemy_dialect.aio", "AsyncOptetyxDialect")
 
 
 # Ensure the dialect is registered on import so it works in editable/test mode
@@ -1,24 +1,24 @@
 import os
+import re
 from pathlib import Path
 
+# KEY=value lines, with optional quotes around the value and an optional trailing comment;
+# a '#' only starts a comment after whitespace, so unquoted values (secrets) may contain it
+_ENV_RE = re.compile(
+    rb"^[ \t]*(?P<k>[A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*"
+    rb"(?P<v>\"[^\"\n]*\"|'[^'\n]*'|[^\n]*?)[ \t]*(?:[ \t]#[^\n]*)?$",
+    re.M,
+)
+
 
 def load_dotenv_simple(path=".env"):
     p = Path(path)
     if not p.exists():
         return
-    for raw in p.read_text().splitlines():
-        line = raw.strip()
-        if not line or line.startswith("#"):
-            continue
-        if "=" not in line:
-            continue
-        key, val = line.split("=", 1)
-        key = key.strip()
-        val = val.strip()
+    for match in _ENV_RE.finditer(p.read_bytes()):
+        val = match["v"].strip()
         # Remove surrounding quotes, if present
-        if (val.startswith('"') and val.endswith('"')) or (
-            val.startswith("'") and val.endswith("'")
-        ):
+        if val[:1] in (b'"', b"'") and val[-1:] == val[:1]:
             val = val[1:-1]
 
-        os.environ[key] = val
+        os.environ[match["k"].decode()] = val.decode()
@@ -0,0 +1,20 @@
+import pathlib
+
+import pytest
+
+from tests import load_dotenv_simple
+
+
+def _find_env_file() -> pathlib.Path:
+    current_dir = pathlib.Path(__file__).resolve().parent
+    for directory in (current_dir,) + tuple(current_dir.parents):
+        candidate = directory / ".env"
+        if candidate.exists():
+            return candidate
+    return pathlib.Path(".env")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _load_env() -> None:
+    """Load the nearest .env file once per test session."""
+    load_dotenv_simple(str(_find_env_file()))
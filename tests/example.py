@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import logging
-import os
+import pathlib
 import sys
 
 # Make local package importable in editable/test mode (same pattern as tests/plain_script)
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+_PARENT = str(pathlib.Path(__file__).resolve().parent.parent)
+if _PARENT not in sys.path:
+    sys.path.insert(0, _PARENT)
 
 # Import the package so the dialect registers itself in editable/test mode
 import sqlalchemy_dialect  # noqa: F401
@@ -6,19 +6,30 @@ Simple smoke-test script for Opteryx auth + data endpoints.
 
 from __future__ import annotations
 
+import io
 import os
+import pathlib
 import sys
 import time
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from itertools import zip_longest
 from typing import Any
+from typing import Callable
 from typing import Dict
+from typing import Iterable
+from typing import Iterator
 from typing import Optional
 from typing import Sequence
 
 import orjson
 import requests
+from requests.adapters import HTTPAdapter
 from orso import DataFrame
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+_PARENT = str(pathlib.Path(__file__).resolve().parent.parent)
+if _PARENT not in sys.path:
+    sys.path.insert(0, _PARENT)
 
 from tests import load_dotenv_simple
 
@@ -27,6 +38,21 @@ try:
 except ImportError:  # pragma: no cover - optional dependency for brotli
     brotli = None
 
+try:
+    import zstandard  # type: ignore[import]
+except ImportError:  # pragma: no cover - optional dependency for zstd
+    zstandard = None
+
+try:
+    import httpx  # type: ignore[import]
+except ImportError:  # pragma: no cover - optional dependency for HTTP/2 polling
+    httpx = None
+
+try:
+    import ijson  # type: ignore[import]
+except ImportError:  # pragma: no cover - optional dependency for streaming JSON parsing
+    ijson = None
+
 
 load_dotenv_simple("../.env")
 
@@ -36,6 +62,55 @@ DEFAULT_DATA_URL = "https://jobs.opteryx.app"
 DEFAULT_CLIENT_ID = os.environ.get("CLIENT_ID")
 DEFAULT_CLIENT_SECRET = os.environ.get("CLIENT_SECRET")
 SQL_STATEMENT = "SELECT * FROM $planets AS P"
+# Once a statement has been running this long, start downloading results alongside polling
+PREFETCH_AFTER_SECONDS = 1.0
+
+# Concurrent page downloads once the first page reports the total row count
+MAX_PAGE_WORKERS = 8
+
+# Uncompressed result bodies larger than this are parsed incrementally when ijson is available
+STREAM_PARSE_BYTES = 1024 * 1024
+
+# ijson events that open or close a container or name a key, rather than carry a value
+_OPENING_EVENTS = frozenset(("start_map", "start_array", "map_key"))
+_CONTAINER_EVENTS = _OPENING_EVENTS | {"end_map", "end_array"}
+
+# Statement states after which polling stops
+_TERMINAL = frozenset({"COMPLETED", "FAILED", "CANCELLED", "INCHOATE"})
+
+# Shared stand-in for a column without values
+_EMPTY = ()
+
+# Encodings the results download can decode, fastest to decompress first. Only that request
+# advertises them: it decompresses zstd and br itself, while other responses are parsed as
+# the HTTP client returns them and rely on its own (gzip) decoding
+RESULTS_ACCEPT_ENCODING = ", ".join(
+    name for name, available in (("zstd", zstandard), ("br", brotli), ("gzip", True)) if available
+)
+
+
+def _make_session() -> requests.Session:
+    """Create a keep-alive session, so repeated calls (like status polls) reuse a socket."""
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+    return session
+
+
+SESSION = _make_session()
+
+# Errors raised by either HTTP client when a request fails
+HTTP_ERRORS = (requests.RequestException,) + ((httpx.HTTPError,) if httpx else ())
+
+
+def _make_http2_client(token: str) -> Optional["httpx.Client"]:
+    """Create an HTTP/2 client for polling and downloads, if httpx is installed."""
+    if httpx is None:
+        return None
+    headers = {"Authorization": f"Bearer {token}"}
+    try:
+        return httpx.Client(http2=True, timeout=10, headers=headers)
+    except ImportError:  # pragma: no cover - httpx without the h2 extra
+        return httpx.Client(timeout=10, headers=headers)
 
 
 def fatal(msg: str) -> None:
@@ -77,63 +152,149 @@ def get_token(
     if key_date:
         data["key_date"] = key_date
 
-    r = requests.post(url, data=data, timeout=10)
+    r = SESSION.post(url, data=data, timeout=10)
     if r.status_code != 200:
         raise RuntimeError(f"token endpoint returned status {r.status_code}: {r.text}")
-    body = r.json()
+    body = orjson.loads(r.content)
     token = body.get("access_token")
     if not token:
         raise RuntimeError("token endpoint returned no access_token")
     return token
 
 
-def create_statement(
-    data_url: str, token: str, sql: str = "SELECT 1", describe_only: bool | None = None
-) -> Dict[str, Any]:
-    url = f"{data_url.rstrip('/')}/api/v1/jobs"
-    headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
-    payload: Dict[str, Any] = {
-        "sql_text": sql,
-        "client_info": {"application_name": "smoke_test_script"},
-    }
-    if describe_only is not None:
-        payload["describeOnly"] = describe_only
-
-    r = requests.post(url, json=payload, headers=headers, timeout=10)
-    r.raise_for_status()
-    return r.json()
-
-
-def get_statement_status(data_url: str, token: str, handle: str) -> Dict[str, Any]:
-    url = f"{data_url.rstrip('/')}/api/v1/jobs/{handle}/status"
-    headers = {"Authorization": f"Bearer {token}"}
-    r = requests.get(url, headers=headers, timeout=10)
-    r.raise_for_status()
-    return r.json()
-
-
-def get_statement_data(
-    data_url: str, token: str, handle: str, offset: Optional[int] = None
-) -> Dict[str, Any]:
-    url = f"{data_url.rstrip('/')}/api/v1/jobs/{handle}/results"
-    if offset is not None:
-        url += f"?offset={offset}"
-    headers = {"Authorization": f"Bearer {token}"}
-    if brotli is not None:
-        headers["Accept-Encoding"] = "br"
-    r = requests.get(url, headers=headers, timeout=10)
-    r.raise_for_status()
-    encoding = r.headers.get("Content-Encoding", "")
-    if encoding.lower() == "br":
-        if not brotli:
-            raise RuntimeError("response is brotli encoded but brotli library is unavailable")
-        try:
-            content = brotli.decompress(r.content)
-        except brotli.error:
-            # Already decompressed or corrupt stream; fall back to raw bytes
-            content = r.content
-        return orjson.loads(content)
-    return r.json()
+class OpteryxClient:
+    """Jobs API calls for one data URL and token, sharing a session and its headers."""
+
+    def __init__(self, data_url: str, token: str) -> None:
+        self.jobs_url = f"{data_url.rstrip('/')}/api/v1/jobs"
+        self.session = _make_session()
+        self.session.headers["Authorization"] = f"Bearer {token}"
+        # Status polls and the results download share one multiplexed connection when
+        # httpx is available; otherwise they use the requests session
+        self.http = _make_http2_client(token)
+
+    def create_statement(
+        self, sql: str = "SELECT 1", describe_only: bool | None = None
+    ) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {
+            "sql_text": sql,
+            "client_info": {"application_name": "smoke_test_script"},
+        }
+        if describe_only is not None:
+            payload["describeOnly"] = describe_only
+
+        r = self.session.post(
+            self.jobs_url,
+            data=orjson.dumps(payload),
+            headers={"Content-Type": "application/json"},
+            timeout=10,
+        )
+        r.raise_for_status()
+        return orjson.loads(r.content)
+
+    def get_statement_status(self, handle: str) -> Dict[str, Any]:
+        url = f"{self.jobs_url}/{handle}/status"
+        r = self.http.get(url) if self.http is not None else self.session.get(url, timeout=10)
+        r.raise_for_status()
+        return orjson.loads(r.content)
+
+    def get_statement_data(self, handle: str, offset: Optional[int] = None) -> Dict[str, Any]:
+        url = f"{self.jobs_url}/{handle}/results"
+        if offset is not None:
+            url += f"?offset={offset}"
+        headers = {"Accept-Encoding": RESULTS_ACCEPT_ENCODING}
+        if self.http is not None:
+            with self.http.stream("GET", url, headers=headers) as r:
+                r.raise_for_status()
+                return self._decode_body(r.headers, r.iter_raw(65536), r.read)
+        r = self.session.get(url, headers=headers, stream=True, timeout=10)
+        r.raise_for_status()
+        if (
+            ijson is not None
+            and r.headers.get("Content-Encoding", "").lower() not in ("zstd", "br")
+            and int(r.headers.get("Content-Length") or 0) > STREAM_PARSE_BYTES
+        ):
+            # Yield columns as they are parsed off the socket rather than buffering the body
+            r.raw.decode_content = True
+            return self._stream_envelope(r.raw)
+        # Read straight from the socket with urllib3's decoding off
+        raw_chunks = iter(lambda: r.raw.read(65536, decode_content=False), b"")
+        return self._decode_body(r.headers, raw_chunks, lambda: r.content)
+
+    def get_all_statement_data(self, handle: str) -> Dict[str, Any]:
+        """Fetch every page of results, requesting the pages after the first concurrently."""
+        first = self.get_statement_data(handle)
+        columns = first.get("data")
+        if columns is not None and not isinstance(columns, list):
+            # Streamed columns must be consumed before the envelope's total_rows is known
+            columns = first["data"] = list(columns)
+        total_rows = first.get("total_rows")
+        if not isinstance(columns, list) or not columns or not total_rows:
+            return first
+        page_size = max(len(column.get("values") or _EMPTY) for column in columns)
+        offsets = range(page_size, int(total_rows), page_size) if page_size else range(0)
+        if not offsets:
+            return first
+
+        with ThreadPoolExecutor(max_workers=min(MAX_PAGE_WORKERS, len(offsets))) as pool:
+            pages = list(pool.map(lambda offset: self.get_statement_data(handle, offset), offsets))
+        # Pages arrive in offset order; append each page's values to the matching column
+        for column in columns:
+            column["values"] = list(column.get("values") or _EMPTY)
+        for page in pages:
+            for column, page_column in zip(columns, page.get("data") or _EMPTY):
+                column["values"].extend(page_column.get("values") or _EMPTY)
+        return first
+
+    @staticmethod
+    def _stream_envelope(raw: Any) -> Dict[str, Any]:
+        """Parse a results body incrementally, yielding its columns one at a time.
+
+        The returned dict's "data" is a generator; the envelope's other top-level values
+        (such as total_rows) are added to the dict as the parser reaches them, so they
+        are complete once "data" has been consumed.
+        """
+        envelope: Dict[str, Any] = {}
+
+        def columns() -> Iterator[Dict[str, Any]]:
+            builder = None
+            for prefix, event, value in ijson.parse(raw, use_float=True):
+                if prefix == "data.item" or prefix.startswith("data.item."):
+                    if builder is None:
+                        builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                    # An item is complete at its closing event, or is a single value
+                    if prefix == "data.item" and event not in _OPENING_EVENTS:
+                        yield builder.value
+                        builder = None
+                elif "." not in prefix and prefix and event not in _CONTAINER_EVENTS:
+                    envelope[prefix] = value
+
+        envelope["data"] = columns()
+        return envelope
+
+    @staticmethod
+    def _decode_body(
+        headers: Any, raw_chunks: Iterable[bytes], read_body: Callable[[], bytes]
+    ) -> Dict[str, Any]:
+        """Parse a response body, decompressing zstd and brotli ourselves."""
+        encoding = headers.get("Content-Encoding", "").lower()
+        if encoding == "zstd":
+            if not zstandard:
+                raise RuntimeError("response is zstd encoded but zstandard library is unavailable")
+            decompress = zstandard.ZstdDecompressor().decompressobj().decompress
+        elif encoding == "br":
+            if not brotli:
+                raise RuntimeError("response is brotli encoded but brotli library is unavailable")
+            decompress = brotli.Decompressor().process
+        else:
+            return orjson.loads(read_body())
+        # Decompress chunks as they arrive; the HTTP client's own decoding is bypassed so
+        # the body is decoded exactly once and never held compressed in full
+        buffer = io.BytesIO()
+        for chunk in raw_chunks:
+            buffer.write(decompress(chunk))
+        return orjson.loads(buffer.getvalue())
 
 
 def statement_results_to_dataframe(columns: Optional[Sequence[Dict[str, Any]]]) -> DataFrame:
@@ -149,23 +310,40 @@ def statement_results_to_dataframe(columns: Optional[Sequence[Dict[str, Any]]])
         name = column.get("name")
         if name is None:
             continue
-        values = column.get("values") or []
-        column_entries.append((str(name), list(values)))
+        values = column.get("values")
+        if values is None:
+            values = _EMPTY
+        # orjson already yields lists; only copy other iterables
+        if not isinstance(values, (list, tuple)):
+            values = list(values)
+        column_entries.append((str(name), values))
 
     if not column_entries:
         return DataFrame(rows=[], schema=[])
 
+    if len(column_entries) == 1:
+        # A single column needs no transpose; zip() wraps each value in a 1-tuple
+        name, values = column_entries[0]
+        return DataFrame(rows=list(zip(values)), schema=[name])
+
     column_names = [name for name, _ in column_entries]
     column_values = [values for _, values in column_entries]
-    max_rows = max((len(values) for values in column_values), default=0)
-    rows = [
-        tuple(values[index] if index < len(values) else None for values in column_values)
-        for index in range(max_rows)
-    ]
+    # Orso DataFrames hold rows, so the columns have to be transposed; columns of equal
+    # length (the usual case) take plain zip, only ragged ones need None padding
+    if len({len(values) for values in column_values}) == 1:
+        rows = list(zip(*column_values))
+    else:
+        rows = list(zip_longest(*column_values, fillvalue=None))
 
     return DataFrame(rows=rows, schema=column_names)
 
 
+def _reports_total_rows(resp: Dict[str, Any]) -> bool:
+    """Whether a status response carries total_rows, at the top level or in its status."""
+    status = resp.get("status")
+    return "total_rows" in resp or (isinstance(status, dict) and "total_rows" in status)
+
+
 def main() -> int:
     result = SmokeTestResult()
 
@@ -181,7 +359,8 @@ def main() -> int:
     # Create statement
     try:
         print("→ Creating statement...")
-        resp = create_statement(DEFAULT_DATA_URL, token, sql=SQL_STATEMENT)
+        client = OpteryxClient(DEFAULT_DATA_URL, token)
+        resp = client.create_statement(sql=SQL_STATEMENT)
         handle = resp.get("execution_id")
         if not handle:
             raise RuntimeError("response missing execution_id")
@@ -196,24 +375,65 @@ def main() -> int:
         print("→ Polling statement status...")
         start = time.time()
         state = None
-        while True:
-            resp = get_statement_status(DEFAULT_DATA_URL, token, handle)
-            state = resp.get("status", {})
-            print(f"  status -> {state}         ", end="\r")
-            if state in ("COMPLETED", "FAILED", "CANCELLED", "INCHOATE"):
-                # We'll treat successful fetch as OK. Data service may be a stub and not actually run work.
-                break
-            if time.time() - start > 60:
-                raise RuntimeError("timed out waiting for terminal status")
-            time.sleep(0.5)
-        if state == "COMPLETED":
-            resp = get_statement_data(DEFAULT_DATA_URL, token, handle)
-            table = statement_results_to_dataframe(resp.get("data", []))
-            print(table)
+        # Back off from a quick first re-check so short queries finish in a poll or two
+        delay = 0.05
+        prefetch: Optional[Future] = None
+        # Redraw the progress line only on a terminal, and only when the state changes
+        show_progress = sys.stdout.isatty()
+        prev_state = None
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            while True:
+                resp = client.get_statement_status(handle)
+                status = resp.get("status", {})
+                # The status is either the state itself or an object holding it
+                state = status.get("state") if isinstance(status, dict) else status
+                if show_progress and state != prev_state:
+                    sys.stdout.write(f"  status -> {state}         \r")
+                    sys.stdout.flush()
+                    prev_state = state
+                if state in _TERMINAL:
+                    # We'll treat successful fetch as OK. Data service may be a stub and not actually run work.
+                    break
+                if time.time() - start > 60:
+                    raise RuntimeError("timed out waiting for terminal status")
+                if (
+                    prefetch is None
+                    and state == "RUNNING"
+                    and time.time() - start > PREFETCH_AFTER_SECONDS
+                    and _reports_total_rows(resp)
+                ):
+                    # Speculatively download results so they're ready when the status flips;
+                    # only worthwhile when the status carries total_rows to validate them by
+                    prefetch = executor.submit(client.get_all_statement_data, handle)
+                time.sleep(delay)
+                delay = min(delay * 1.5, 2.0)
+            if state == "COMPLETED":
+                # A prefetch issued while RUNNING may hold a partial page; only trust it when
+                # its total_rows agrees with the row count the completed status reports
+                expected_rows = resp.get("total_rows")
+                if expected_rows is None and isinstance(status, dict):
+                    expected_rows = status.get("total_rows")
+                prefetched = None
+                if prefetch is not None:
+                    if expected_rows is None:
+                        # Nothing to validate the prefetch against; don't wait for it
+                        prefetch.cancel()
+                    elif prefetch.exception() is None:
+                        prefetched = prefetch.result()
+                if (
+                    prefetched is not None
+                    and expected_rows is not None
+                    and prefetched.get("total_rows") == expected_rows
+                ):
+                    resp = prefetched
+                else:
+                    resp = client.get_all_statement_data(handle)
+                table = statement_results_to_dataframe(resp.get("data", []))
+                print(table)
 
         print()
         result.ok(f"Fetched statement status: {state}")
-    except requests.RequestException as exc:
+    except HTTP_ERRORS as exc:
         if resp:
             print("Last response:", resp)
         result.fail(f"Failed to fetch statement status: {exc}")
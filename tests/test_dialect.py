@@ -1,33 +1,24 @@
 import os
+import pathlib
 import sys
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+_PARENT = str(pathlib.Path(__file__).resolve().parent.parent)
+if _PARENT not in sys.path:
+    sys.path.insert(0, _PARENT)
 
-import pathlib
 import pytest
 from sqlalchemy import create_engine, text
 from sqlalchemy.engine import Engine
-from tests import load_dotenv_simple
 
 
 def _get_engine_from_env() -> Engine:
-    env_path = _find_env_file()
-    load_dotenv_simple(str(env_path))
+    # .env is loaded once per session by the fixture in conftest.py
     connection_string = os.getenv("OPTERYX_CONNECTION_STRING")
     if not connection_string:
         pytest.skip("OPTERYX_CONNECTION_STRING missing (set in .env or env vars)")
     return create_engine(connection_string)
 
 
-def _find_env_file() -> pathlib.Path:
-    current_dir = pathlib.Path(__file__).resolve().parent
-    for directory in (current_dir,) + tuple(current_dir.parents):
-        candidate = directory / ".env"
-        if candidate.exists():
-            return candidate
-    return pathlib.Path(".env")
-
-
 def test_opteryx_connection():
     engine = _get_engine_from_env()
 
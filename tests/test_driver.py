@@ -1,14 +1,31 @@
 """Tests for the Opteryx SQLAlchemy dialect."""
 
+import asyncio
+import base64
+import json
+import time
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
 import pytest
+from sqlalchemy import text
+from sqlalchemy_dialect import aio
 from sqlalchemy_dialect import dbapi
 from sqlalchemy_dialect.dialect import OptetyxDialect
 from sqlalchemy_dialect.dialect import _quote_identifier
 
 
+def _json_response(payload, status_code=200):
+    """Build a mock HTTP response carrying a JSON body."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.content = json.dumps(payload).encode()
+    response.text = response.content.decode()
+    response.headers = {}
+    response.json.return_value = payload
+    return response
+
+
 class TestQuoteIdentifier:
     """Tests for identifier quoting."""
 
@@ -87,6 +104,30 @@ class TestConnection:
         assert conn._session.headers["Authorization"] == "Bearer test-token"
         conn.close()
 
+    def test_connection_http_adapter(self):
+        """Test that the session uses a pooled, retrying HTTP adapter."""
+        conn = dbapi.Connection(host="jobs.opteryx.app", port=443, ssl=True)
+        adapter = conn._session.get_adapter("https://jobs.opteryx.app")
+        assert adapter._pool_maxsize == 64
+        assert adapter.max_retries.total == 3
+        # A submit that timed out may have started the statement, so reads aren't retried
+        assert adapter.max_retries.read == 0
+        assert conn._jobs_url == "https://jobs.opteryx.app/api/v1/jobs"
+        conn.close()
+
+    def test_connections_share_http_adapter(self):
+        """Test that connections share one adapter and closing one leaves it mounted on others."""
+        first = dbapi.Connection(host="jobs.opteryx.app", port=443, ssl=True)
+        second = dbapi.Connection(host="jobs.opteryx.app", port=443, ssl=True)
+        adapter = first._session.get_adapter("https://jobs.opteryx.app")
+        assert adapter is second._session.get_adapter("https://jobs.opteryx.app")
+
+        with patch.object(adapter, "close") as mock_close:
+            first.close()
+            mock_close.assert_not_called()
+        assert second._session.get_adapter("https://jobs.opteryx.app") is adapter
+        second.close()
+
     def test_connection_close(self):
         """Test closing connection."""
         conn = dbapi.Connection()
@@ -160,8 +201,7 @@ class TestCursor:
         conn = dbapi.Connection()
         cursor = conn.cursor()
         # Set up some fake data
-        cursor._rows = [(1, "a"), (2, "b")]
-        cursor._row_index = 0
+        cursor._row_iter = iter([(1, "a"), (2, "b")])
 
         results = list(cursor)
         assert results == [(1, "a"), (2, "b")]
@@ -171,8 +211,7 @@ class TestCursor:
         """Test fetchone with no results."""
         conn = dbapi.Connection()
         cursor = conn.cursor()
-        cursor._rows = []
-        cursor._row_index = 0
+        cursor._row_iter = iter([])
         assert cursor.fetchone() is None
         conn.close()
 
@@ -180,12 +219,12 @@ class TestCursor:
         """Test fetchmany."""
         conn = dbapi.Connection()
         cursor = conn.cursor()
-        cursor._rows = [(1,), (2,), (3,), (4,), (5,)]
-        cursor._row_index = 0
+        cursor._row_iter = iter([(1,), (2,), (3,), (4,), (5,)])
         cursor.arraysize = 2
 
         result = cursor.fetchmany()
         assert result == [(1,), (2,)]
+        assert cursor.fetchmany(-1) == []
         result = cursor.fetchmany(3)
         assert result == [(3,), (4,), (5,)]
         conn.close()
@@ -194,12 +233,79 @@ class TestCursor:
         """Test fetchall."""
         conn = dbapi.Connection()
         cursor = conn.cursor()
-        cursor._rows = [(1,), (2,), (3,)]
-        cursor._row_index = 0
+        cursor._row_iter = iter([(1,), (2,), (3,)])
 
         result = cursor.fetchall()
         assert result == [(1,), (2,), (3,)]
-        assert cursor._row_index == 3
+        assert cursor.fetchall() == []
+        conn.close()
+
+    def test_fetch_from_columns(self):
+        """Test that columnar results are turned into rows as they are fetched."""
+        conn = dbapi.Connection()
+        cursor = conn.cursor()
+        cursor._statement_handle = "handle-columns"
+        cursor._fetch_results(
+            {
+                "data": [
+                    {"name": "id", "values": [1, 2, 3, 4]},
+                    {"name": "name", "values": ["a", "b", "c", "d"]},
+                ],
+                "total_rows": 4,
+            }
+        )
+        assert cursor.rowcount == 4
+
+        assert cursor.fetchone() == (1, "a")
+        assert cursor.fetchmany(2) == [(2, "b"), (3, "c")]
+        assert cursor.fetchall() == [(4, "d")]
+        assert cursor.fetchone() is None
+        conn.close()
+
+    def test_fetch_results_columnar_then_rows(self):
+        """Test that a row-format page after a columnar page keeps all rows in order."""
+        conn = dbapi.Connection()
+        cursor = conn.cursor()
+        cursor._statement_handle = "handle-mixed"
+        cursor.arraysize = 2
+        first_page = {
+            "status": {"state": "COMPLETED"},
+            "data": [{"name": "id", "values": [1, 2]}, {"name": "name", "values": ["a"]}],
+            "total_rows": 3,
+        }
+        second_page = {"data": [{"id": 3, "name": "c"}], "columns": [{"name": "id"}]}
+
+        with patch.object(dbapi.Connection, "_get_statement_results", return_value=second_page):
+            cursor._fetch_results(first_page)
+
+        assert cursor.rowcount == 3
+        assert cursor.fetchall() == [(1, "a"), (2, None), (3, "c")]
+        conn.close()
+
+    def test_fetch_results_parallel_pages(self):
+        """Test that remaining pages are fetched concurrently and kept in offset order."""
+        conn = dbapi.Connection()
+        cursor = conn.cursor()
+        cursor._statement_handle = "handle-parallel"
+        cursor.arraysize = 10
+        first_page = {
+            "data": [[i] for i in range(10)],
+            "columns": [{"name": "n"}],
+            "total_rows": 35,
+        }
+
+        def get_page(self, handle, num_rows=None, offset=None):
+            time.sleep(0.01 * (35 - offset) / 10)  # later pages finish first
+            return {"data": [[i] for i in range(offset, min(offset + num_rows, 35))]}
+
+        with patch.object(
+            dbapi.Connection, "_get_statement_results", autospec=True, side_effect=get_page
+        ) as mock_results:
+            cursor._fetch_results(first_page)
+
+        offsets = sorted(call.kwargs["offset"] for call in mock_results.call_args_list)
+        assert offsets == [10, 20, 30]
+        assert cursor.fetchall() == [(i,) for i in range(35)]
         conn.close()
 
     @patch("requests.Session.post")
@@ -207,24 +313,22 @@ class TestCursor:
     def test_execute_success(self, mock_get, mock_post):
         """Test successful statement execution."""
         # Mock POST response (statement submission)
-        post_response = MagicMock()
-        post_response.status_code = 201
-        post_response.json.return_value = {"execution_id": "handle-123"}
+        post_response = _json_response({"execution_id": "handle-123"}, status_code=201)
         mock_post.return_value = post_response
 
         # Mock GET responses (status polling)
-        get_response = MagicMock()
-        get_response.status_code = 200
-        get_response.json.return_value = {
-            "execution_id": "handle-123",
-            "status": {"state": "SUCCEEDED"},
-            # Columnar results: each entry contains 'name' and 'values' list
-            "data": [
-                {"name": "id", "type": "INTEGER", "values": [1]},
-                {"name": "value", "type": "STRING", "values": ["test"]},
-            ],
-            "total_rows": 1,
-        }
+        get_response = _json_response(
+            {
+                "execution_id": "handle-123",
+                "status": {"state": "SUCCEEDED"},
+                # Columnar results: each entry contains 'name' and 'values' list
+                "data": [
+                    {"name": "id", "type": "INTEGER", "values": [1]},
+                    {"name": "value", "type": "STRING", "values": ["test"]},
+                ],
+                "total_rows": 1,
+            },
+        )
         mock_get.return_value = get_response
 
         conn = dbapi.Connection()
@@ -234,7 +338,150 @@ class TestCursor:
         assert cursor._statement_handle == "handle-123"
         assert cursor.description is not None
         assert len(cursor.description) == 2
-        assert cursor._rows == [(1, "test")]
+        assert cursor.fetchall() == [(1, "test")]
+        conn.close()
+
+    @patch("requests.Session.post")
+    def test_execute_positional_parameters(self, mock_post):
+        """Test that ? placeholders are rewritten to named :pN parameters."""
+        mock_post.return_value = _json_response(
+            {
+                "execution_id": "handle-qmark",
+                "status": {"state": "COMPLETED"},
+                "data": [],
+                "total_rows": 0,
+            },
+            status_code=201,
+        )
+
+        conn = dbapi.Connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT * FROM t WHERE a = ? AND b IN (?, ?) AND c = '?'", [1, 2, 3])
+
+        payload = json.loads(mock_post.call_args.kwargs["data"])
+        assert payload["sql_text"] == (
+            "SELECT * FROM t WHERE a = :p0 AND b IN (:p1, :p2) AND c = '?'"
+        )
+        assert payload["parameters"] == {"p0": 1, "p1": 2, "p2": 3}
+        conn.close()
+
+    @patch("requests.Session.post")
+    @patch("requests.Session.get")
+    def test_executemany_batches(self, mock_get, mock_post):
+        """Test that executemany submits every parameter set in one request."""
+        mock_post.return_value = _json_response({"execution_id": "handle-batch"}, status_code=201)
+        mock_get.return_value = _json_response(
+            {"status": {"state": "COMPLETED"}, "rows_affected": [1, 2], "data": []}
+        )
+
+        conn = dbapi.Connection()
+        cursor = conn.cursor()
+        cursor.executemany("SELECT * FROM t WHERE a = ?", [(1,), (2,)])
+
+        assert mock_post.call_count == 1
+        payload = json.loads(mock_post.call_args.kwargs["data"])
+        assert payload["sql_text"] == "SELECT * FROM t WHERE a = :p0"
+        assert payload["batch"] == [{"p0": 1}, {"p0": 2}]
+        assert cursor.rowcount == 3
+        conn.close()
+
+    @patch("requests.Session.post")
+    def test_executemany_falls_back_when_unsupported(self, mock_post):
+        """Test that executemany runs statements one by one if batches are unsupported."""
+        unsupported = _json_response({"detail": "Not Found"}, status_code=404)
+        unsupported.raise_for_status.side_effect = __import__("requests").exceptions.HTTPError(
+            response=unsupported
+        )
+        inline = _json_response(
+            {"execution_id": "h", "status": {"state": "COMPLETED"}, "data": [], "total_rows": 0},
+            status_code=201,
+        )
+        mock_post.side_effect = [unsupported, inline, inline]
+
+        conn = dbapi.Connection()
+        cursor = conn.cursor()
+        cursor.executemany("SELECT :a", [{"a": 1}, {"a": 2}])
+
+        assert mock_post.call_count == 3
+        assert json.loads(mock_post.call_args.kwargs["data"])["parameters"] == {"a": 2}
+        conn.close()
+
+    @patch("requests.Session.post")
+    def test_executemany_mismatched_parameters_not_batched(self, mock_post):
+        """Test that parameter sets which rewrite the SQL differently run one by one."""
+        mock_post.return_value = _json_response(
+            {"execution_id": "h", "status": {"state": "COMPLETED"}, "data": [], "total_rows": 0},
+            status_code=201,
+        )
+
+        conn = dbapi.Connection()
+        cursor = conn.cursor()
+        cursor.executemany("INSERT INTO t VALUES (?, ?)", [(1, 2), (3,)])
+
+        payloads = [json.loads(c.kwargs["data"]) for c in mock_post.call_args_list]
+        assert all("batch" not in payload for payload in payloads)
+        assert [payload["parameters"] for payload in payloads] == [{"p0": 1, "p1": 2}, {"p0": 3}]
+        conn.close()
+
+    @patch("requests.Session.post")
+    @patch("requests.Session.get")
+    def test_executemany_batch_total_rowcount(self, mock_get, mock_post):
+        """Test that a batch reporting one total affected-row count isn't run again."""
+        mock_post.return_value = _json_response({"execution_id": "handle-batch"}, status_code=201)
+        mock_get.return_value = _json_response(
+            {"status": {"state": "COMPLETED"}, "rows_affected": 1, "data": []}
+        )
+
+        conn = dbapi.Connection()
+        cursor = conn.cursor()
+        cursor.executemany("SELECT :a", [{"a": 1}, {"a": 2}])
+
+        assert mock_post.call_count == 1
+        assert cursor.rowcount == 1
+        assert conn._batch_unsupported is False
+        conn.close()
+
+    @patch("requests.Session.post")
+    @patch("requests.Session.get")
+    def test_executemany_batch_failure_raises(self, mock_get, mock_post):
+        """Test that a failed batch raises rather than being re-run one statement at a time."""
+        mock_post.return_value = _json_response({"execution_id": "handle-batch"}, status_code=201)
+        mock_get.return_value = _json_response(
+            {"status": {"state": "FAILED"}, "error_message": "syntax error"}
+        )
+
+        conn = dbapi.Connection()
+        cursor = conn.cursor()
+        with pytest.raises(dbapi.ProgrammingError, match="syntax error"):
+            cursor.executemany("SELEC :a", [{"a": 1}, {"a": 2}])
+
+        assert mock_post.call_count == 1
+        assert conn._batch_unsupported is False
+        conn.close()
+
+    @patch("requests.Session.post")
+    @patch("requests.Session.get")
+    def test_execute_inline_results(self, mock_get, mock_post):
+        """Test that results inlined in the submit response skip status polling."""
+        mock_post.return_value = _json_response(
+            {
+                "execution_id": "handle-inline",
+                "status": {"state": "COMPLETED"},
+                "data": [{"name": "id", "type": "INTEGER", "values": [1, 2]}],
+                "total_rows": 2,
+            },
+            status_code=201,
+        )
+
+        conn = dbapi.Connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT id FROM test")
+
+        assert cursor.fetchall() == [(1,), (2,)]
+        assert mock_get.call_count == 0
+        payload = json.loads(mock_post.call_args.kwargs["data"])
+        assert payload["wait"] == 25
+        assert payload["fetch_rows"] == 10
         conn.close()
 
     @patch("requests.Session.post")
@@ -242,73 +489,59 @@ class TestCursor:
     def test_fetch_results_columnar_pagination(self, mock_get, mock_post):
         """Test pagination with columnar results using num_rows/offset."""
         # Mock authless POST response
-        post_response = MagicMock()
-        post_response.status_code = 201
-        post_response.json.return_value = {"execution_id": "handle-321"}
+        post_response = _json_response({"execution_id": "handle-321"}, status_code=201)
         mock_post.return_value = post_response
 
         # Pagination: first status request returns completion, then results pages stream the rows
-        first_get = MagicMock()
-        first_get.status_code = 200
-        first_get.json.return_value = {
-            "execution_id": "handle-321",
-            "status": {"state": "SUCCEEDED"},
-            "data": [
-                {"name": "id", "type": "INTEGER", "values": [1, 2]},
-                {"name": "name", "type": "STRING", "values": ["a", "b"]},
-            ],
-            "total_rows": 3,
-        }
+        first_get = _json_response(
+            {
+                "execution_id": "handle-321",
+                "status": {"state": "SUCCEEDED"},
+                "data": [
+                    {"name": "id", "type": "INTEGER", "values": [1, 2]},
+                    {"name": "name", "type": "STRING", "values": ["a", "b"]},
+                ],
+                "total_rows": 3,
+            },
+        )
 
-        second_get = MagicMock()
-        second_get.status_code = 200
-        second_get.json.return_value = {
-            "execution_id": "handle-321",
-            "status": {"state": "SUCCEEDED"},
-            "data": [
-                {"name": "id", "type": "INTEGER", "values": [3]},
-                {"name": "name", "type": "STRING", "values": ["c"]},
-            ],
-            "total_rows": 3,
-        }
+        # The download endpoint streams the remaining row as NDJSON
+        download = _json_response({"id": 3, "name": "c"})
+        download.content += b"\n"
 
-        # The first call is the status poll, the next two are paginated results
-        mock_get.side_effect = [first_get, first_get, second_get]
+        # The first call is the status poll, the second downloads the rows after it
+        mock_get.side_effect = [first_get, download]
 
         conn = dbapi.Connection()
         cursor = conn.cursor()
         cursor.arraysize = 2
         cursor.execute("SELECT id, name FROM planets")
 
-        assert cursor._rows == [(1, "a"), (2, "b"), (3, "c")]
+        assert cursor.fetchall() == [(1, "a"), (2, "b"), (3, "c")]
         assert cursor._rowcount == 3
+        assert "offset=2" in mock_get.call_args.args[0]
         conn.close()
 
     @patch("requests.Session.post")
     @patch("requests.Session.get")
     def test_cursor_auth_retrieves_token(self, mock_get, mock_post):
-        """Test that Cursor.__init__ retrieves JWT token using client credentials and stores it on the cursor."""
+        """Test that the connection retrieves a JWT using client credentials and cursors use it."""
         # Mock auth POST response (first call)
-        auth_response = MagicMock()
-        auth_response.status_code = 200
-        auth_response.text = '{"access_token":"jwt-123"}'
-        auth_response.json.return_value = {"access_token": "jwt-123"}
+        auth_response = _json_response({"access_token": "jwt-123"})
 
         # Mock statement POST response (second call) for submit
-        post_response = MagicMock()
-        post_response.status_code = 201
-        post_response.json.return_value = {"execution_id": "handle-123"}
+        post_response = _json_response({"execution_id": "handle-123"}, status_code=201)
         mock_post.side_effect = [auth_response, post_response]
 
         # Mock GET responses (status polling)
-        get_response = MagicMock()
-        get_response.status_code = 200
-        get_response.json.return_value = {
-            "execution_id": "handle-123",
-            "status": "SUCCEEDED",
-            "data": [{"name": "id", "type": "INTEGER", "values": [1]}],
-            "total_rows": 1,
-        }
+        get_response = _json_response(
+            {
+                "execution_id": "handle-123",
+                "status": "SUCCEEDED",
+                "data": [{"name": "id", "type": "INTEGER", "values": [1]}],
+                "total_rows": 1,
+            },
+        )
         mock_get.return_value = get_response
 
         conn = dbapi.Connection(
@@ -330,12 +563,200 @@ class TestCursor:
         assert second_call_url.endswith("jobs.opteryx.app/api/v1/jobs")
         conn.close()
 
+    @patch("requests.Session.post")
+    def test_cursors_share_cached_token(self, mock_post):
+        """Test that the JWT is cached on the connection and reused until near expiry."""
+        claims = base64.urlsafe_b64encode(json.dumps({"exp": time.time() + 3600}).encode())
+        jwt = f"header.{claims.decode().rstrip('=')}.signature"
+        auth_response = _json_response({"access_token": jwt})
+        mock_post.return_value = auth_response
+
+        conn = dbapi.Connection(username="client", token="secret", host="opteryx.app")
+        first = conn.cursor()
+        second = conn.cursor()
+
+        assert first._jwt_token == second._jwt_token == jwt
+        assert mock_post.call_count == 1
+
+        # Once the token is about to expire the next request re-authenticates
+        conn._jwt_exp = time.time() + 10
+        assert conn._ensure_token() == jwt
+        assert mock_post.call_count == 2
+        conn.close()
+
+    @patch("requests.Session.post")
+    def test_failed_refresh_recovers_on_execute(self, mock_post):
+        """Test that a failed token refresh drops the old JWT and a later execute recovers."""
+        claims = base64.urlsafe_b64encode(json.dumps({"exp": time.time() + 10}).encode())
+        jwt = f"header.{claims.decode().rstrip('=')}.signature"
+        submit_response = _json_response(
+            {
+                "execution_id": "handle-1",
+                "status": {"state": "COMPLETED"},
+                "data": [],
+                "total_rows": 0,
+            }
+        )
+        token_responses = [
+            _json_response({"access_token": jwt}),
+            dbapi.requests.exceptions.ConnectionError("no route"),
+            _json_response({"access_token": "fresh-jwt"}),
+        ]
+
+        def post(url, *args, **kwargs):
+            if not url.endswith("/token"):
+                return submit_response
+            response = token_responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        mock_post.side_effect = post
+
+        conn = dbapi.Connection(username="client", token="secret", host="localhost")
+        cursor = conn.cursor()
+        # The JWT is about to expire, so the statement tries to refresh it and fails
+        cursor.execute("SELECT 1")
+        assert conn._jwt_token is None
+        assert conn._session.headers["Authorization"] == "Bearer secret"
+
+        conn._auth_failed_at -= 120
+        cursor.execute("SELECT 1")
+        assert conn._jwt_token == "fresh-jwt"
+        assert conn._session.headers["Authorization"] == "Bearer fresh-jwt"
+        conn.close()
+
+    @patch("requests.Session.post")
+    def test_unreachable_auth_is_not_retried(self, mock_post):
+        """Test that an unreachable token endpoint is skipped until the backoff expires."""
+        submit_response = _json_response(
+            {
+                "execution_id": "handle-1",
+                "status": {"state": "COMPLETED"},
+                "data": [],
+                "total_rows": 0,
+            }
+        )
+
+        def post(url, *args, **kwargs):
+            if url.endswith("/token"):
+                raise dbapi.requests.exceptions.ConnectionError("no route")
+            return submit_response
+
+        mock_post.side_effect = post
+
+        def token_calls():
+            return sum(c.args[0].endswith("/token") for c in mock_post.call_args_list)
+
+        conn = dbapi.Connection(username="client", token="secret", host="localhost")
+        assert conn._jwt_token is None
+        cursor = conn.cursor()
+        cursor.execute("SELECT 1")
+        assert token_calls() == 1
+
+        # Once the backoff has expired the next statement tries to authenticate again
+        conn._auth_failed_at -= 61
+        cursor.execute("SELECT 1")
+        assert token_calls() == 2
+        cursor.execute("SELECT 1")
+        assert token_calls() == 2
+        conn.close()
+
+    @patch("requests.Session.post")
+    def test_rejected_auth_is_not_retried_per_statement(self, mock_post):
+        """Test that a rejected login isn't repeated for every executed statement."""
+        auth_response = _json_response({"detail": "invalid client"}, status_code=401)
+        auth_response.raise_for_status.side_effect = dbapi.requests.exceptions.HTTPError(
+            response=auth_response
+        )
+        submit_response = _json_response(
+            {
+                "execution_id": "handle-1",
+                "status": {"state": "COMPLETED"},
+                "data": [],
+                "total_rows": 0,
+            }
+        )
+
+        def post(url, *args, **kwargs):
+            return auth_response if url.endswith("/token") else submit_response
+
+        mock_post.side_effect = post
+
+        conn = dbapi.Connection(username="client", token="secret", host="localhost")
+        cursor = conn.cursor()
+        for _ in range(3):
+            cursor.execute("SELECT 1")
+
+        token_calls = [c for c in mock_post.call_args_list if c.args[0].endswith("/token")]
+        assert len(token_calls) == 1
+        conn.close()
+
+    @patch("time.sleep")
+    @patch("requests.Session.post")
+    @patch("requests.Session.get")
+    def test_poll_long_polls_then_falls_back(self, mock_get, mock_post, mock_sleep):
+        """Status polls request a server-side wait and fall back to sleeping if unsupported."""
+        post_response = _json_response({"execution_id": "handle-789"}, status_code=201)
+        mock_post.return_value = post_response
+
+        running = _json_response({"status": {"state": "RUNNING"}})
+        done = _json_response({"status": {"state": "SUCCEEDED"}, "data": [], "total_rows": 0})
+        mock_get.side_effect = [running, running, done, done]
+
+        conn = dbapi.Connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT 1")
+
+        # First two polls long-poll; the immediate, unchanged RUNNING disables it
+        assert mock_get.call_args_list[0].kwargs["params"] == {"wait": 25}
+        assert mock_get.call_args_list[1].kwargs["params"] == {"wait": 25}
+        assert mock_get.call_args_list[2].kwargs["params"] is None
+        assert mock_sleep.call_count == 1
+        conn.close()
+
+    @patch("requests.Session.get")
+    def test_status_revalidates_with_etag(self, mock_get):
+        """Test that status polls send If-None-Match and reuse the cached body on 304."""
+        running = _json_response({"status": {"state": "RUNNING"}, "progress": 1})
+        running.headers = {"ETag": '"v1"'}
+        unchanged = MagicMock()
+        unchanged.status_code = 304
+        done = _json_response({"status": {"state": "COMPLETED"}})
+        done.headers = {"ETag": '"v2"'}
+        mock_get.side_effect = [running, unchanged, done]
+
+        conn = dbapi.Connection()
+        assert conn._get_statement_status("h")["progress"] == 1
+        assert conn._get_statement_status("h")["progress"] == 1
+        assert mock_get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+        assert conn._get_statement_status("h")["status"]["state"] == "COMPLETED"
+        # Finished statements are not revalidated, so their entry is dropped
+        assert "h" not in conn._status_etags
+        conn.close()
+
+    @patch("requests.Session.post")
+    @patch("requests.Session.get")
+    def test_poll_error_drops_cached_status(self, mock_get, mock_post):
+        """Test that the cached status is dropped when polling ends with an error."""
+        mock_post.return_value = _json_response({"execution_id": "handle-404"}, status_code=201)
+        running = _json_response({"status": {"state": "RUNNING"}})
+        running.headers = {"ETag": '"v1"'}
+        missing = _json_response({"detail": "not found"}, status_code=404)
+        missing.raise_for_status.side_effect = dbapi.requests.exceptions.HTTPError(response=missing)
+        mock_get.side_effect = [running, missing]
+
+        conn = dbapi.Connection()
+        cursor = conn.cursor()
+        with pytest.raises(dbapi.ProgrammingError):
+            cursor.execute("SELECT 1")
+        assert "handle-404" not in conn._status_etags
+        conn.close()
+
     @patch("requests.Session.post")
     def test_execute_http_error(self, mock_post):
         """Test execute with HTTP error."""
-        mock_response = MagicMock()
-        mock_response.status_code = 401
-        mock_response.json.return_value = {"detail": "Unauthorized"}
+        mock_response = _json_response({"detail": "Unauthorized"}, status_code=401)
         mock_response.raise_for_status.side_effect = __import__("requests").exceptions.HTTPError(
             response=mock_response
         )
@@ -348,20 +769,28 @@ class TestCursor:
             cursor.execute("SELECT * FROM test")
         conn.close()
 
+    @patch("requests.Session.post")
+    def test_execute_rejects_unsafe_handle(self, mock_post):
+        """Test that execution IDs which would escape the URL path are rejected."""
+        mock_post.return_value = _json_response({"execution_id": "../admin"}, status_code=201)
+
+        conn = dbapi.Connection()
+        cursor = conn.cursor()
+
+        with pytest.raises(dbapi.DatabaseError, match="Invalid statement handle"):
+            cursor.execute("SELECT 1")
+        conn.close()
+
     @patch("requests.Session.post")
     @patch("requests.Session.get")
     def test_execute_failed_statement(self, mock_get, mock_post):
         """Test execute with failed statement."""
-        post_response = MagicMock()
-        post_response.status_code = 201
-        post_response.json.return_value = {"execution_id": "handle-456"}
+        post_response = _json_response({"execution_id": "handle-456"}, status_code=201)
         mock_post.return_value = post_response
 
-        get_response = MagicMock()
-        get_response.status_code = 200
-        get_response.json.return_value = {
-            "status": {"state": "FAILED", "description": "Syntax error"}
-        }
+        get_response = _json_response(
+            {"status": {"state": "FAILED", "description": "Syntax error"}},
+        )
         mock_get.return_value = get_response
 
         conn = dbapi.Connection()
@@ -375,20 +804,18 @@ class TestCursor:
     @patch("requests.Session.get")
     def test_execute_no_data_response(self, mock_get, mock_post):
         """If the server returns success but no columns/data, the cursor should still be usable and return empty rows."""
-        post_response = MagicMock()
-        post_response.status_code = 201
-        post_response.json.return_value = {"execution_id": "handle-empty"}
+        post_response = _json_response({"execution_id": "handle-empty"}, status_code=201)
         mock_post.return_value = post_response
 
         # Status indicates completion but no data payload
-        get_response = MagicMock()
-        get_response.status_code = 200
-        get_response.json.return_value = {
-            "execution_id": "handle-empty",
-            "status": {"state": "SUCCEEDED"},
-            "total_rows": 0,
-            "data": [],
-        }
+        get_response = _json_response(
+            {
+                "execution_id": "handle-empty",
+                "status": {"state": "SUCCEEDED"},
+                "total_rows": 0,
+                "data": [],
+            },
+        )
         mock_get.return_value = get_response
 
         conn = dbapi.Connection()
@@ -400,6 +827,110 @@ class TestCursor:
         assert cursor.fetchall() == []
         conn.close()
 
+    @patch("requests.Session.get")
+    def test_get_statement_results_parses_ndjson(self, mock_get):
+        """Test that the download endpoint's NDJSON body is parsed into row dicts."""
+        response = MagicMock()
+        response.status_code = 200
+        response.headers = {"Content-Length": "40"}
+        response.content = b'{"id": 1, "name": "a"}\n{"id": 2, "name": "b"}\n'
+        mock_get.return_value = response
+
+        conn = dbapi.Connection()
+        result = conn._get_statement_results("handle-1", num_rows=10, offset=0)
+
+        assert result["data"] == [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]
+        assert result["columns"] == [{"name": "id"}, {"name": "name"}]
+        assert mock_get.call_args.args[0] == (
+            "http://jobs.opteryx.app:8000/api/v1/jobs/handle-1/download"
+            "?file_format=json&limit=10&offset=0"
+        )
+        conn.close()
+
+
+class TestAsync:
+    """Tests for the asyncio connection and dialect."""
+
+    @patch("requests.Session.post")
+    def test_async_cursor(self, mock_post):
+        """Test executing and fetching through AsyncConnection/AsyncCursor."""
+        mock_post.return_value = _json_response(
+            {
+                "execution_id": "handle-async",
+                "status": {"state": "COMPLETED"},
+                "data": [{"name": "id", "values": [1, 2]}],
+                "total_rows": 2,
+            },
+            status_code=201,
+        )
+
+        async def run():
+            async with await aio.connect(host="localhost") as conn:
+                cursor = await conn.cursor()
+                await cursor.execute("SELECT id FROM t")
+                return [row async for row in cursor]
+
+        assert asyncio.run(run()) == [(1,), (2,)]
+
+    @patch("requests.Session.post")
+    def test_async_cursors_share_connection_serially(self, mock_post):
+        """Test that cursors on one AsyncConnection don't execute in overlapping threads."""
+        active = []
+        overlaps = []
+
+        def post(*args, **kwargs):
+            active.append(1)
+            overlaps.append(len(active) > 1)
+            time.sleep(0.02)
+            active.pop()
+            return _json_response(
+                {
+                    "execution_id": "h",
+                    "status": {"state": "COMPLETED"},
+                    "data": [],
+                    "total_rows": 0,
+                },
+                status_code=201,
+            )
+
+        mock_post.side_effect = post
+
+        async def run():
+            async with await aio.connect(host="localhost") as conn:
+                cursors = [await conn.cursor() for _ in range(3)]
+                await asyncio.gather(*(cursor.execute("SELECT 1") for cursor in cursors))
+
+        asyncio.run(run())
+        assert len(overlaps) == 3 and not any(overlaps)
+
+    @patch("requests.Session.post")
+    def test_async_engine(self, mock_post):
+        """Test that create_async_engine works with opteryx+async:// URLs."""
+        # sqlalchemy.ext.asyncio can't be imported without greenlet
+        pytest.importorskip("greenlet")
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        mock_post.return_value = _json_response(
+            {
+                "execution_id": "handle-async",
+                "status": {"state": "COMPLETED"},
+                "data": [{"name": "id", "values": [1, 2]}],
+                "total_rows": 2,
+            },
+            status_code=201,
+        )
+
+        async def run():
+            engine = create_async_engine("opteryx+async://localhost:8000/default")
+            try:
+                async with engine.connect() as conn:
+                    result = await conn.execute(text("SELECT id FROM t"))
+                    return result.fetchall()
+            finally:
+                await engine.dispose()
+
+        assert asyncio.run(run()) == [(1,), (2,)]
+
 
 class TestDialect:
     """Tests for the SQLAlchemy dialect."""